@@ -10,23 +10,33 @@ if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 try:
-    from fastapi import FastAPI, HTTPException
-    from fastapi.responses import HTMLResponse
-    from pydantic import BaseModel, HttpUrl
+    from fastapi import FastAPI, HTTPException, Request
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
+    from fastapi.staticfiles import StaticFiles
+    from pydantic import BaseModel, field_validator
 except ImportError as exc:
     raise ImportError(
         "FastAPI and its dependencies are required. Install them with "
         "`pip install -r requirements.txt`."
     ) from exc
 
-from datetime import datetime
+import codecs
+from collections import OrderedDict
+from contextlib import aclosing
+from datetime import datetime, timezone
+from functools import lru_cache
+import hashlib
 import httpx
-from selectolax.parser import HTMLParser
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
-from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
+from urllib.parse import urljoin, urlsplit, urlunsplit
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import logging
+import os
+from pathlib import Path
 
 # Configure logging
 logging.basicConfig(
@@ -38,82 +48,220 @@ logger = logging.getLogger(__name__)
 if sys.platform == 'win32':
     logger.info("Windows detected - ProactorEventLoop policy set for Playwright compatibility")
 
-app = FastAPI(title="Universal Website Scraper")
+class StreamAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes streamed endpoints through uncompressed,
+    so each line reaches the client instead of waiting in the compressor"""
+    
+    def __init__(self, app, uncompressed_paths: frozenset, **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.uncompressed_paths = uncompressed_paths
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.uncompressed_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# orjson serializes the large sections/rawHtml payloads much faster than stdlib json
+app = FastAPI(title="Universal Website Scraper", default_response_class=ORJSONResponse)
+app.add_middleware(StreamAwareGZipMiddleware, minimum_size=500,
+                   uncompressed_paths=frozenset({"/scrape/stream"}))
+
+# Frontend assets are served from disk so Starlette handles ETag/304 caching
+STATIC_DIR = Path(__file__).parent / "static"
+static_files = StaticFiles(directory=STATIC_DIR)
+app.mount("/static", static_files, name="static")
 
 # --- Models ---
 class ScrapeRequest(BaseModel):
-    url: HttpUrl
+    url: str
+    load_images: bool = False  # Let Playwright download images (galleries)
+    
+    @field_validator('url')
+    @classmethod
+    def check_url(cls, value: str) -> str:
+        """Cheap scheme/host/length check instead of full HttpUrl parsing"""
+        value = value.strip()
+        if len(value) > MAX_URL_LENGTH:
+            raise ValueError(f"URL longer than {MAX_URL_LENGTH} characters")
+        if not value[:8].lower().startswith(('http://', 'https://')):
+            raise ValueError("Only http(s) URLs are supported")
+        if not urlsplit(value).netloc:
+            raise ValueError("URL must include a host")
+        return value
 
 # --- Configuration ---
 STATIC_THRESHOLD = 200  # Min text length to consider static scraping successful
 TIMEOUT_MS = 30000
 MAX_CONTENT_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_URL_LENGTH = 2048
 SCROLL_WAIT_MS = 2000
 MAX_SCROLLS = 3
+MAX_CONCURRENT_BROWSERS = 4  # Max Playwright scrapes running at once
+MAX_HTTP_CONNECTIONS = 200
+MAX_KEEPALIVE_CONNECTIONS = 100
+PARSE_CACHE_SIZE = 256  # Static parse results kept per (url, content hash)
+# Shared Chromium (e.g. a sidecar) for multi-worker deployments; unset = launch our own
+PLAYWRIGHT_CDP_URL = os.environ.get("PLAYWRIGHT_CDP_URL")
+# Keep timers and rendering at full speed: headless pages can be treated as
+# backgrounded, which throttles the setTimeout-driven lazy loading we wait on.
+# Linux/Unix systems also need the sandbox flags for headless mode, and a
+# small /dev/shm in containers crashes long-lived browsers.
+BROWSER_LAUNCH_ARGS = (
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows'
+) + (() if sys.platform == 'win32' else (
+    '--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage'
+))
+# Start Playwright alongside a static fetch that is still running after this
+# many seconds; fast static pages never touch the browser. None disables.
+SPECULATIVE_PLAYWRIGHT_DELAY = 1.5
+# Only tags/attributes are parsed, so the browser never needs these bytes
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+USER_AGENT = 'Mozilla/5.0 (compatible; LyftrScraper/1.0)'
+TRACKING_PREFIXES = ('utm_', 'fbclid', 'gclid', 'ref_')  # Query params stripped from URLs
+SECTION_TAGS = ('header', 'nav', 'main', 'article', 'section', 'aside', 'footer')
+SECTION_SELECTOR = ', '.join(SECTION_TAGS)
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+HEADING_SELECTOR = ', '.join(HEADING_TAGS)
+JS_MARKERS = (
+    'react', 'vue', 'angular', 'next.js', 'nuxt', 'svelte',
+    '__next', 'data-reactroot', 'ng-app', 'v-application',
+    'id="__next"', 'id="root"', 'id="app"', 'id="main"'
+)
+JS_MARKERS_BYTES = tuple(marker.encode() for marker in JS_MARKERS)
+# Per-section caps; extraction stops as soon as each one is reached
+MAX_SECTION_LINKS = 10
+MAX_SECTION_IMAGES = 5
+MAX_SECTION_LISTS = 3
+MAX_SECTION_TABLES = 2
 NOISE_SELECTORS = [
     '[id*="cookie"]', '[class*="cookie"]',
     '[id*="newsletter"]', '[class*="newsletter"]',
     '[class*="popup"]', '[class*="modal"]'
 ]
+NOISE_SELECTOR = ', '.join(NOISE_SELECTORS)
+# Playwright selectors (:has-text is not plain CSS), tried in this order
+CLICK_SELECTORS = [
+    'button:has-text("Load more")',
+    'button:has-text("Show more")',
+    'a:has-text("Load more")',
+    '[role="tab"]',
+    '[data-testid*="more"]',
+    '.load-more',
+    '#load-more',
+    'button[aria-label*="more" i]',
+    'button[aria-label*="load" i]'
+]
+CLICK_SELECTOR = ', '.join(CLICK_SELECTORS)
+PAGINATION_SELECTORS = ['a[rel="next"]', '.next', '.pagination a:has-text("Next")', 'a:has-text("›")']
 
 # --- Utility Functions ---
+_WS_RE = re.compile(r'\s+')
+_LANG_RE = re.compile(r'<html[^>]*\slang=["\']([^"\']+)["\']', re.IGNORECASE)
+_LANG_RE_B = re.compile(rb'<html[^>]*\slang=["\']([^"\']+)["\']', re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
 def clean_url(url: str, base_url: str) -> str:
     """Make URL absolute and remove tracking parameters"""
     abs_url = urljoin(base_url, url)
-    parsed = urlparse(abs_url)
+    # Fast path: nothing to strip without a query or a tracking param in it
+    if '?' not in abs_url or not any(p in abs_url for p in TRACKING_PREFIXES):
+        return abs_url
+    parsed = urlsplit(abs_url)
     
-    # Remove tracking params
+    # Remove tracking params; the rest of the query is kept verbatim
     if parsed.query:
-        params = parse_qs(parsed.query)
-        clean_params = {k: v for k, v in params.items() 
-                       if not k.startswith(('utm_', 'fbclid', 'gclid', 'ref_'))}
-        clean_query = urlencode(clean_params, doseq=True)
+        clean_query = '&'.join(pair for pair in parsed.query.split('&')
+                               if pair and not pair.startswith(TRACKING_PREFIXES))
         parsed = parsed._replace(query=clean_query)
     
-    return urlunparse(parsed)
+    return urlunsplit(parsed)
 
 def is_same_domain(url1: str, url2: str) -> bool:
     """Check if two URLs are from the same domain"""
-    return urlparse(url1).netloc == urlparse(url2).netloc
+    return urlsplit(url1).netloc == urlsplit(url2).netloc
+
+def is_same_netloc(netloc: str, url: str) -> bool:
+    """Check a URL against an already-parsed netloc"""
+    return urlsplit(url).netloc == netloc
 
-def detect_language(html: str) -> str:
-    """Simple language detection from HTML"""
-    lang_match = re.search(r'<html[^>]*\slang=["\']([^"\']+)["\']', html)
+def detect_language(html: Union[str, bytes]) -> str:
+    """Simple language detection from HTML (str or raw bytes)"""
+    if isinstance(html, bytes):
+        lang_match = _LANG_RE_B.search(html)
+        if lang_match:
+            return lang_match.group(1).decode('ascii', errors='ignore')
+        return "en"
+    lang_match = _LANG_RE.search(html)
     if lang_match:
         return lang_match.group(1)
     return "en"
 
 def truncate_html(html: str, max_bytes: int = 5000) -> tuple[str, bool]:
     """Safely truncate HTML to max bytes"""
-    if len(html.encode('utf-8')) <= max_bytes:
+    # A UTF-8 char is at most 4 bytes, and never less than 1, so the char
+    # count alone settles most cases without encoding the whole string
+    if len(html) <= max_bytes // 4:
+        return html, False
+    if len(html) <= max_bytes and len(html.encode('utf-8')) <= max_bytes:
         return html, False
     
-    # Truncate at character boundary
-    truncated = html[:max_bytes]
+    # Only the first max_bytes chars can fit; cut at a character boundary
+    truncated = html[:max_bytes].encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore')
     return truncated + "...", True
 
+def utc_timestamp() -> str:
+    """Current UTC time in ISO 8601 with a Z suffix"""
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
 def normalize_text(text: str) -> str:
     """Normalize whitespace in text"""
-    return re.sub(r'\s+', ' ', text).strip()
+    return _WS_RE.sub(' ', text).strip()
+
+def collect_text(elem, cap: int = 500) -> tuple[str, bool]:
+    """Normalized text of elem, cut to cap chars; stops walking once cap is hit.
+    
+    Returns (text, truncated). Equivalent to normalizing elem.text() and
+    slicing, without materializing the text of the whole subtree.
+    """
+    parts = []
+    raw_len = 0
+    next_check = cap
+    for node in elem.traverse(include_text=True):
+        if node.tag != '-text':
+            continue
+        text = node.text_content
+        if text:
+            parts.append(text)
+            raw_len += len(text)
+            # Normalized text never exceeds the raw length, so only
+            # re-check once enough raw text has been gathered
+            if raw_len > next_check:
+                text = normalize_text(''.join(parts))
+                if len(text) > cap:
+                    return text[:cap], True
+                next_check = raw_len * 2
+    text = normalize_text(''.join(parts))
+    if len(text) > cap:
+        return text[:cap], True
+    return text, False
 
 # --- Static Scraping ---
-def is_js_rendered(html: str, tree: HTMLParser) -> bool:
+def is_js_rendered(html: Union[str, bytes], tree: LexborHTMLParser) -> bool:
     """Detect if page is likely JS-rendered (React, Vue, Next.js, etc.)"""
     html_lower = html.lower()
     
     # Check for JS framework markers
-    js_markers = [
-        'react', 'vue', 'angular', 'next.js', 'nuxt', 'svelte',
-        '__next', 'data-reactroot', 'ng-app', 'v-application',
-        'id="__next"', 'id="root"', 'id="app"', 'id="main"'
-    ]
+    js_markers = JS_MARKERS_BYTES if isinstance(html, bytes) else JS_MARKERS
     
     # Count script tags (JS-rendered pages often have many)
     script_count = len(tree.css('script'))
     
     # Check body content - JS shells often have minimal body text
-    body_text = tree.body.text() if tree.body else ""
-    body_text_clean = normalize_text(body_text)
+    # (only the first 500 chars matter, so stop reading there)
+    body_text_clean, _ = collect_text(tree.body, 500) if tree.body else ("", False)
     
     # Check for common JS-rendered patterns
     has_js_marker = any(marker in html_lower for marker in js_markers)
@@ -125,7 +273,7 @@ def is_js_rendered(html: str, tree: HTMLParser) -> bool:
     has_empty_main = False
     if main_elements:
         for main in main_elements:
-            main_text = normalize_text(main.text() if main.text else "")
+            main_text, _ = collect_text(main, 100)
             if len(main_text) < 100:  # Main content area is mostly empty
                 has_empty_main = True
                 break
@@ -140,67 +288,136 @@ def is_js_rendered(html: str, tree: HTMLParser) -> bool:
     # If 2+ indicators, likely JS-rendered
     return indicators >= 2
 
+def remove_noise(tree: LexborHTMLParser) -> None:
+    """Remove cookie/newsletter/popup elements, as the browser path does"""
+    if tree.body is None:
+        return
+    # Search below <body> only: substring selectors also match e.g.
+    # <body class="modal-open">, which would take the whole page with it.
+    # A node can match several selectors; key by identity to visit it once
+    matched = {node.mem_id: node for node in tree.body.css(NOISE_SELECTOR)}
+    # Only decompose outermost matches: nested ones go with their ancestor,
+    # and must not be touched once that subtree has been destroyed
+    outermost = []
+    for node in matched.values():
+        parent = node.parent
+        while parent is not None and parent.mem_id not in matched:
+            parent = parent.parent
+        if parent is None:
+            outermost.append(node)
+    for node in outermost:
+        node.decompose()
+
+def parse_rendered(html: str, url: str) -> Dict[str, Any]:
+    """Parse the final HTML of a rendered page"""
+    return parse_html_content(LexborHTMLParser(html), url, html)
+
+def parse_static(html: Union[str, bytes], url: str) -> Optional[Dict[str, Any]]:
+    """Parse a fetched page, or return None if it should go to Playwright"""
+    tree = LexborHTMLParser(html)
+    
+    # FIRST: Check if this looks like a JS-rendered page
+    if is_js_rendered(html, tree):
+        logger.info("Page appears to be JS-rendered, will use Playwright")
+        return None
+    
+    # SECOND: Check if we have sufficient meaningful content
+    # Script text length comes first: it bounds how much body text the
+    # ratio check below needs, so the body is only read that far
+    script_len = sum(len(normalize_text(script.text() or "")) for script in tree.css('script'))
+    text_needed = max(STATIC_THRESHOLD, script_len // 2 + 1)
+    main_text_clean, _ = collect_text(tree.body, text_needed) if tree.body else ("", False)
+    
+    logger.info(f"Static scraping - text length: {len(main_text_clean)} (read up to {text_needed})")
+    
+    # Check for meaningful content (not just meta tags and scripts)
+    # Look for actual content elements
+    content_elements = tree.css('article, section, main, [role="main"], .content, .post, .article')
+    has_content_elements = len(content_elements) > 0
+    
+    # Check if body has substantial text content
+    has_sufficient_text = len(main_text_clean) >= STATIC_THRESHOLD
+    
+    # Fallback if insufficient content
+    if not has_sufficient_text and not has_content_elements:
+        logger.info("Static scraping insufficient content, will try Playwright")
+        return None
+    
+    # Additional check: if text is mostly from scripts/meta, it's likely JS-rendered
+    # Body text read up to text_needed is exact whenever this can trigger
+    if script_len > 0 and main_text_clean:
+        script_ratio = script_len / len(main_text_clean)
+        if script_ratio > 2.0:  # Scripts are 2x the body text
+            logger.info("High script-to-content ratio, likely JS-rendered")
+            return None
+    
+    logger.info("Static scraping successful")
+    remove_noise(tree)
+    return parse_html_content(tree, url, html)
+
+# (url, charset, content digest) -> parse_static() result, oldest first.
+# Results are stored serialized, so every hit decodes a private copy that
+# callers can modify without affecting later hits
+_parse_cache: "OrderedDict[tuple, Optional[bytes]]" = OrderedDict()
+
 async def scrape_static(url: str) -> Optional[Dict[str, Any]]:
     """Attempt static scraping with httpx + Selectolax"""
     try:
         logger.info(f"Attempting static scraping for: {url}")
-        async with httpx.AsyncClient(follow_redirects=True, timeout=10.0) as client:
-            response = await client.get(url, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; LyftrScraper/1.0)'
-            })
+        # Shared client created at startup so connection pools survive across requests
+        client = app.state.http_client
+        # Stream the body so oversized pages are dropped at the limit
+        # instead of being downloaded in full first
+        async with client.stream('GET', url) as response:
             response.raise_for_status()
             
-            if len(response.content) > MAX_CONTENT_SIZE:
-                logger.warning(f"Content too large: {len(response.content)} bytes")
-                return None
-            
-            html = response.text
-            tree = HTMLParser(html)
-            
-            # FIRST: Check if this looks like a JS-rendered page
-            if is_js_rendered(html, tree):
-                logger.info("Page appears to be JS-rendered, will use Playwright")
-                return None
-            
-            # SECOND: Check if we have sufficient meaningful content
-            main_text = tree.body.text() if tree.body else ""
-            main_text_clean = normalize_text(main_text)
-            
-            logger.info(f"Static scraping - text length: {len(main_text_clean)}")
-            
-            # Check for meaningful content (not just meta tags and scripts)
-            # Look for actual content elements
-            content_elements = tree.css('article, section, main, [role="main"], .content, .post, .article')
-            has_content_elements = len(content_elements) > 0
-            
-            # Check if body has substantial text content
-            has_sufficient_text = len(main_text_clean) >= STATIC_THRESHOLD
-            
-            # Fallback if insufficient content
-            if not has_sufficient_text and not has_content_elements:
-                logger.info("Static scraping insufficient content, will try Playwright")
-                return None
-            
-            # Additional check: if text is mostly from scripts/meta, it's likely JS-rendered
-            script_text = ""
-            for script in tree.css('script'):
-                script_text += script.text() if script.text else ""
-            script_text_clean = normalize_text(script_text)
-            
-            # If script text is a large portion of total text, likely JS-rendered
-            if len(script_text_clean) > 0 and len(main_text_clean) > 0:
-                script_ratio = len(script_text_clean) / len(main_text_clean)
-                if script_ratio > 2.0:  # Scripts are 2x the body text
-                    logger.info("High script-to-content ratio, likely JS-rendered")
+            content = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                content += chunk
+                if len(content) > MAX_CONTENT_SIZE:
+                    logger.warning(f"Content too large: over {MAX_CONTENT_SIZE} bytes")
                     return None
-            
-            logger.info("Static scraping successful")
-            return parse_html_content(tree, url, html)
+        
+        try:
+            charset = codecs.lookup(response.charset_encoding or 'utf-8').name
+        except LookupError:
+            charset = 'utf-8'  # Unknown label: fall back like response.text did
+        
+        # Parsing is deterministic in (url, charset, body): repeat fetches of
+        # an unchanged page reuse the previous result
+        cache_key = (url, charset, hashlib.blake2b(content, digest_size=16).digest())
+        if cache_key in _parse_cache:
+            _parse_cache.move_to_end(cache_key)
+            cached = _parse_cache[cache_key]
+            logger.info("Static parse cache hit")
+            if cached is None:
+                return None
+            return {**orjson.loads(cached), "scrapedAt": utc_timestamp()}
+        
+        # Lexbor parses bytes as UTF-8, so UTF-8 pages skip building a decoded
+        # copy of the whole document; other charsets are decoded here
+        if charset == 'utf-8':
+            html = bytes(content)
+        else:
+            html = content.decode(charset, errors='replace')
+        
+        # Parsing is CPU-bound, keep it off the event loop
+        try:
+            result = await asyncio.to_thread(parse_static, html, url)
+        except UnicodeDecodeError:
+            # Lexbor reads text out of raw bytes strictly; a page with invalid
+            # UTF-8 is reparsed from a lenient decode, as response.text did
+            html = content.decode('utf-8', errors='replace')
+            result = await asyncio.to_thread(parse_static, html, url)
+        _parse_cache[cache_key] = None if result is None else orjson.dumps(result)
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+        return result
     except Exception as e:
         logger.error(f"Static scraping error: {str(e)}")
         return None
 
-def parse_html_content(tree: HTMLParser, base_url: str, raw_html: str) -> Dict[str, Any]:
+def parse_html_content(tree: LexborHTMLParser, base_url: str, raw_html: Union[str, bytes]) -> Dict[str, Any]:
     """Parse HTML tree into structured JSON"""
     
     # Extract meta information
@@ -235,18 +452,31 @@ def parse_html_content(tree: HTMLParser, base_url: str, raw_html: str) -> Dict[s
     sections = []
     section_id = 0
     
-    # Look for semantic sections
-    for selector in ['header', 'nav', 'main', 'article', 'section', 'aside', 'footer']:
-        elements = tree.css(selector)
-        for elem in elements:
-            section_data = extract_section(elem, base_url, section_id, selector)
+    # Look for semantic sections: one tree walk, bucketed by tag so sections
+    # keep their landmark ordering (all headers, then navs, ...)
+    base_netloc = urlsplit(base_url).netloc
+    buckets = {tag: [] for tag in SECTION_TAGS}
+    for elem in tree.css(SECTION_SELECTOR):
+        buckets[elem.tag].append(elem)
+    for selector in SECTION_TAGS:
+        for elem in buckets[selector]:
+            # One guard per section instead of per extracted node
+            try:
+                section_data = extract_section(elem, base_url, section_id, selector, base_netloc)
+            except Exception as e:
+                logger.debug(f"Skipping {selector} section: {e}")
+                continue
             if section_data:
                 sections.append(section_data)
                 section_id += 1
     
     # If no sections found, treat body as one section
     if not sections and tree.body:
-        section_data = extract_section(tree.body, base_url, 0, "unknown")
+        try:
+            section_data = extract_section(tree.body, base_url, 0, "unknown", base_netloc)
+        except Exception as e:
+            logger.debug(f"Skipping body section: {e}")
+            section_data = None
         if section_data:
             sections.append(section_data)
     
@@ -271,7 +501,7 @@ def parse_html_content(tree: HTMLParser, base_url: str, raw_html: str) -> Dict[s
     
     return {
         "url": base_url,
-        "scrapedAt": datetime.utcnow().isoformat() + "Z",
+        "scrapedAt": utc_timestamp(),
         "meta": meta,
         "sections": sections,
         "interactions": {
@@ -282,109 +512,92 @@ def parse_html_content(tree: HTMLParser, base_url: str, raw_html: str) -> Dict[s
         "errors": []
     }
 
-def extract_section(elem, base_url: str, section_id: int, tag_type: str) -> Optional[Dict[str, Any]]:
+def extract_section(elem, base_url: str, section_id: int, tag_type: str,
+                    base_netloc: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Extract structured content from a section element"""
+    if base_netloc is None:
+        base_netloc = urlsplit(base_url).netloc
+    
+    # Serialize the subtree once for rawHtml
+    raw_html = elem.html or ""
     
     # Determine section type
     section_type = infer_section_type(elem, tag_type)
     
-    # Extract headings
-    headings = []
-    for h in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-        for heading in elem.css(h):
-            try:
-                text = normalize_text(heading.text() if heading.text else "")
-                if text:
-                    headings.append(text)
-            except:
-                continue
+    # Extract headings (one selector pass, grouped by level: h1s first)
+    heading_levels = {tag: [] for tag in HEADING_TAGS}
+    for heading in elem.css(HEADING_SELECTOR):
+        text = normalize_text(heading.text() or "")
+        if text:
+            heading_levels[heading.tag].append(text)
+    headings = [text for tag in HEADING_TAGS for text in heading_levels[tag]]
     
-    # Extract text content
-    try:
-        text_content = normalize_text(elem.text() if elem.text else "")
-    except:
-        text_content = ""
-    if len(text_content) > 500:
-        text_content = text_content[:500] + "..."
+    # Extract text content (stops reading once 500 chars are collected)
+    text_content, text_truncated = collect_text(elem, 500)
+    if text_truncated:
+        text_content += "..."
     
     # Extract links
     links = []
     for link in elem.css('a[href]'):
+        if len(links) >= MAX_SECTION_LINKS:
+            break
+        href = link.attributes.get('href') or ''
+        if not href or href.startswith(('#', 'javascript:', 'mailto:')):
+            continue
         try:
-            href = link.attributes.get('href', '') if link.attributes else ''
-            if href and not href.startswith(('#', 'javascript:', 'mailto:')):
-                abs_href = clean_url(href, base_url)
-                if is_same_domain(base_url, abs_href):
-                    link_text = normalize_text(link.text() if link.text else "")
-                    links.append({
-                        "text": link_text,
-                        "href": abs_href
-                    })
-        except:
+            abs_href = clean_url(href, base_url)
+        except ValueError:  # Malformed URL, e.g. a broken IPv6 host
             continue
+        if is_same_netloc(base_netloc, abs_href):
+            links.append({
+                "text": normalize_text(link.text() or ""),
+                "href": abs_href
+            })
     
     # Extract images
     images = []
     for img in elem.css('img[src]'):
+        if len(images) >= MAX_SECTION_IMAGES:
+            break
+        src = img.attributes.get('src') or ''
+        if not src:
+            continue
         try:
-            src = img.attributes.get('src', '') if img.attributes else ''
-            if src:
-                images.append({
-                    "src": clean_url(src, base_url),
-                    "alt": img.attributes.get('alt', '') if img.attributes else ''
-                })
-        except:
+            abs_src = clean_url(src, base_url)
+        except ValueError:
             continue
+        images.append({
+            "src": abs_src,
+            "alt": img.attributes.get('alt') or ''
+        })
     
     # Extract lists
     lists = []
     for ul in elem.css('ul, ol'):
-        try:
-            items = []
-            for li in ul.css('li'):
-                try:
-                    text = normalize_text(li.text() if li.text else "")
-                    if text:
-                        items.append(text)
-                except:
-                    continue
-            if items:
-                lists.append(items)
-        except:
-            continue
+        if len(lists) >= MAX_SECTION_LISTS:
+            break
+        items = []
+        for li in ul.css('li'):
+            text = normalize_text(li.text() or "")
+            if text:
+                items.append(text)
+        if items:
+            lists.append(items)
     
     # Extract tables
     tables = []
     for table in elem.css('table'):
-        try:
-            rows = []
-            for tr in table.css('tr'):
-                try:
-                    cells = []
-                    for td in tr.css('td, th'):
-                        try:
-                            text = normalize_text(td.text() if td.text else "")
-                            if text:
-                                cells.append(text)
-                        except:
-                            continue
-                    if cells:
-                        rows.append(cells)
-                except:
-                    continue
-            if rows:
-                tables.append(rows)
-        except:
-            continue
+        if len(tables) >= MAX_SECTION_TABLES:
+            break
+        rows = extract_table(table)
+        if rows:
+            tables.append(rows)
     
     # Generate label
     label = headings[0] if headings else generate_fallback_label(text_content, section_type)
     
-    # Get raw HTML
-    try:
-        raw_html = elem.html if hasattr(elem, 'html') else ""
-    except:
-        raw_html = ""
+    # Truncate raw HTML
     truncated_html, is_truncated = truncate_html(raw_html, 3000)
     
     return {
@@ -395,35 +608,59 @@ def extract_section(elem, base_url: str, section_id: int, tag_type: str) -> Opti
         "content": {
             "headings": headings,
             "text": text_content,
-            "links": links[:10],  # Limit links
-            "images": images[:5],  # Limit images
-            "lists": lists[:3],  # Limit lists
-            "tables": tables[:2]  # Limit tables
+            "links": links,
+            "images": images,
+            "lists": lists,
+            "tables": tables
         },
         "rawHtml": truncated_html,
         "truncated": is_truncated
     }
 
+def extract_table(table) -> List[List[str]]:
+    """Extract non-empty rows of cell text from a table"""
+    rows = []
+    for tr in table.css('tr'):
+        cells = []
+        # Cells are direct children of <tr>; iterating them avoids a
+        # selector pass per row and keeps th/td in document order
+        for cell in tr.iter():
+            if cell.tag not in ('td', 'th'):
+                continue
+            text = normalize_text(cell.text() or "")
+            if text:
+                cells.append(text)
+        if cells:
+            rows.append(cells)
+    return rows
+
 def infer_section_type(elem, tag_type: str) -> str:
-    """Infer section type from element attributes and content"""
+    """Infer section type from the element's class/id attributes"""
     try:
-        html = elem.html.lower() if hasattr(elem, 'html') and elem.html else ""
+        attrs = elem.attributes or {}
+        hints = f"{attrs.get('class') or ''} {attrs.get('id') or ''}"
+        # Bare wrappers: fall back to the first classed descendant
+        if not hints.strip():
+            first = elem.css_first('[class]')
+            if first is not None:
+                hints = first.attributes.get('class') or ''
     except:
-        html = ""
+        hints = ""
+    hints = hints.lower()
     
-    if tag_type == 'header' or 'hero' in html or 'banner' in html:
+    if tag_type == 'header' or 'hero' in hints or 'banner' in hints:
         return 'hero'
     elif tag_type == 'nav':
         return 'nav'
     elif tag_type == 'footer':
         return 'footer'
-    elif 'faq' in html or 'question' in html:
+    elif 'faq' in hints or 'question' in hints:
         return 'faq'
-    elif 'pricing' in html or 'price' in html:
+    elif 'pricing' in hints or 'price' in hints:
         return 'pricing'
-    elif 'grid' in html or 'cards' in html:
+    elif 'grid' in hints or 'cards' in hints:
         return 'grid'
-    elif 'list' in html:
+    elif 'list' in hints:
         return 'list'
     else:
         return tag_type if tag_type in ['section', 'article', 'aside'] else 'section'
@@ -437,7 +674,55 @@ def generate_fallback_label(text: str, section_type: str) -> str:
     return label or f"Unlabeled {section_type}"
 
 # --- Playwright Scraping ---
-async def scrape_with_playwright(url: str) -> Dict[str, Any]:
+async def launch_browser():
+    """Start Playwright if needed and launch (or connect to) the shared browser"""
+    if app.state.playwright is None:
+        app.state.playwright = await async_playwright().start()
+    if PLAYWRIGHT_CDP_URL:
+        # Workers share one browser process; closing only disconnects
+        logger.info(f"Connecting to browser at {PLAYWRIGHT_CDP_URL}...")
+        browser = await app.state.playwright.chromium.connect_over_cdp(PLAYWRIGHT_CDP_URL)
+        logger.info("Connected to shared browser")
+    else:
+        logger.info("Launching browser...")
+        browser = await app.state.playwright.chromium.launch(
+            headless=True,
+            args=list(BROWSER_LAUNCH_ARGS)
+        )
+        logger.info("Browser launched successfully")
+    app.state.browser = browser
+    return browser
+
+async def get_browser():
+    """Return the shared Chromium instance, launching it on first use"""
+    async with app.state.browser_lock:
+        browser = app.state.browser
+        if browser is not None and browser.is_connected():
+            return browser
+        launch = app.state.browser_launch
+        if launch is None or launch.done():
+            launch = app.state.browser_launch = asyncio.create_task(launch_browser())
+            # A failure nobody ends up awaiting is reported by the next caller
+            launch.add_done_callback(lambda task: task.cancelled() or task.exception())
+    # Shielded so a cancelled caller can't abort a half-started driver or
+    # browser process; the launch completes and is kept for the next caller
+    return await asyncio.shield(launch)
+
+def close_orphaned_context(task: asyncio.Task) -> None:
+    """Close a context whose creator was cancelled before receiving it"""
+    if not task.cancelled() and task.exception() is None:
+        asyncio.ensure_future(task.result().close())
+
+async def open_context(browser):
+    """browser.new_context() that can't leak the context on cancellation"""
+    task = asyncio.ensure_future(browser.new_context())
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        task.add_done_callback(close_orphaned_context)
+        raise
+
+async def scrape_with_playwright(url: str, load_images: bool = False) -> Dict[str, Any]:
     """Scrape using Playwright for JS-rendered content"""
     logger.info(f"Starting Playwright scraping for: {url}")
     errors = []
@@ -447,259 +732,14 @@ async def scrape_with_playwright(url: str) -> Dict[str, Any]:
         "pages": [url]
     }
     
-    browser = None
-    page = None
     try:
-        async with async_playwright() as p:
-            logger.info("Launching browser...")
-            try:
-                # Platform-specific browser launch args
-                launch_args = []
-                # Linux/Unix systems need these flags for headless mode
-                if sys.platform != 'win32':
-                    launch_args = ['--no-sandbox', '--disable-setuid-sandbox']
-                
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=launch_args
-                )
-                logger.info("Browser launched successfully")
-            except Exception as launch_error:
-                error_msg = f"Failed to launch browser: {str(launch_error)}"
-                logger.error(error_msg, exc_info=True)
-                error_detail = str(launch_error)
-                
-                # Check for common browser installation issues
-                if any(keyword in error_detail.lower() for keyword in [
-                    "executable doesn't exist", "browser", "chromium",
-                    "not found", "cannot find", "no such file"
-                ]):
-                    error_detail = "Playwright browser not installed. Please run: playwright install chromium"
-                elif "timeout" in error_detail.lower():
-                    error_detail = f"Browser launch timeout: {error_detail}"
-                elif any(keyword in error_detail.lower() for keyword in [
-                    "permission", "access", "denied", "eacces"
-                ]):
-                    error_detail = f"Permission error launching browser: {error_detail}"
-                
-                raise HTTPException(status_code=500, detail=error_detail)
-            
-            try:
-                page = await browser.new_page()
-                logger.info("New page created")
-            except Exception as page_error:
-                error_msg = f"Failed to create page: {str(page_error)}"
-                logger.error(error_msg, exc_info=True)
-                if browser:
-                    try:
-                        await browser.close()
-                    except:
-                        pass
-                raise HTTPException(status_code=500, detail=error_msg)
-            
-            try:
-                # Navigate to page with better wait strategy
-                logger.info(f"Navigating to {url}")
-                
-                # Try multiple wait strategies for better compatibility
-                navigation_strategies = [
-                    ('domcontentloaded', 3000),
-                    ('load', 2000),
-                    ('networkidle', 1000),
-                ]
-                
-                navigation_success = False
-                last_error = None
-                for wait_until, extra_wait in navigation_strategies:
-                    try:
-                        logger.info(f"Trying navigation with wait_until='{wait_until}'...")
-                        await page.goto(url, wait_until=wait_until, timeout=TIMEOUT_MS)
-                        await page.wait_for_timeout(extra_wait)
-                        logger.info(f"Page loaded with '{wait_until}' event")
-                        navigation_success = True
-                        break
-                    except PlaywrightTimeout as e:
-                        last_error = e
-                        logger.info(f"'{wait_until}' timeout, trying next strategy...")
-                        continue
-                    except Exception as e:
-                        last_error = e
-                        logger.warning(f"Navigation error with '{wait_until}': {e}, trying next...")
-                        continue
-                
-                if not navigation_success:
-                    error_detail = f"Page load timeout - all strategies failed. Last error: {str(last_error) if last_error else 'Unknown'}"
-                    logger.error(error_detail)
-                    raise HTTPException(status_code=408, detail=error_detail)
-                
-                # Wait for content to render...
-                logger.info("Waiting for content to render...")
-                try:
-                    await page.wait_for_function(
-                        """() => {
-                            if (!document.body) return false;
-                            const text = document.body.innerText || '';
-                            const textLength = text.trim().length;
-                            const hasText = textLength > 50;
-                            const hasElements = document.querySelectorAll('article, section, main, [role="main"], .content, p, h1, h2, h3, div').length > 0;
-                            const hasImages = document.querySelectorAll('img[src], img[data-src], img[srcset], img[loading="lazy"]').length > 0;
-                            const hasContainers = document.querySelectorAll('div[class*="grid"], div[class*="card"], div[class*="item"], div[class*="photo"], div[class*="Image"], a[href*="/photos/"]').length > 0;
-                            return hasText || hasElements || hasImages || hasContainers;
-                        }""",
-                        timeout=25000
-                    )
-                    logger.info("Content detected")
-                    await page.wait_for_timeout(4000)
-                    
-                    content_check = await page.evaluate("""() => {
-                        const bodyText = (document.body.innerText || '').trim();
-                        const hasText = bodyText.length > 100;
-                        const hasElements = document.querySelectorAll('article, section, main, p, h1, h2, h3, div[class*="content"]').length > 3;
-                        const hasImages = document.querySelectorAll('img[src], img[data-src]').length > 0;
-                        const hasContainers = document.querySelectorAll('div[class*="grid"], div[class*="card"], div[class*="item"]').length > 0;
-                        return hasText || hasElements || hasImages || hasContainers;
-                    }""")
-                    
-                    if not content_check:
-                        logger.warning("Content check failed - page may still be loading, waiting more...")
-                        await page.wait_for_timeout(5000)
-                except PlaywrightTimeout:
-                    logger.warning("Content wait timeout, checking if any content exists...")
-                    has_any_content = False
-                    try:
-                        has_any_content = await page.evaluate("""() => {
-                            const bodyText = (document.body.innerText || '').trim();
-                            const hasText = bodyText.length > 50;
-                            const hasImages = document.querySelectorAll('img').length > 0;
-                            const hasElements = document.querySelectorAll('div, article, section').length > 5;
-                            return hasText || hasImages || hasElements;
-                        }""")
-                        if not has_any_content:
-                            logger.error("No content detected after timeout")
-                            raise HTTPException(status_code=408, detail="Page content did not load within timeout")
-                    except HTTPException:
-                        raise
-                    except Exception as e:
-                        logger.warning(f"Content check error: {e}")
-                    if not has_any_content:
-                        logger.error("No content detected after timeout")
-                        raise HTTPException(status_code=408, detail="Page content did not load within timeout")
-                    await page.wait_for_timeout(3000)
-                except Exception as e:
-                    logger.warning(f"Content wait error: {e}, proceeding anyway...")
-                    await page.wait_for_timeout(3000)
-                
-                logger.info("Page loaded successfully")
-                
-                # Remove noise elements
-                for selector in NOISE_SELECTORS:
-                    try:
-                        await page.evaluate("""
-                            (selector) => {
-                                try {
-                                    document.querySelectorAll(selector).forEach(el => {
-                                        try { el.remove(); } catch(e) {}
-                                    });
-                                } catch(e) {}
-                            }
-                        """, selector)
-                    except Exception as e:
-                        logger.debug(f"Failed to remove noise element {selector}: {e}")
-                        pass
-                
-                # Wait for lazy-loaded images and content
-                logger.info("Waiting for lazy-loaded content...")
-                await page.wait_for_timeout(2000)
-                
-                try:
-                    await page.wait_for_function(
-                        """() => {
-                            const images = Array.from(document.querySelectorAll('img'));
-                            const loadedImages = images.filter(img => img.complete && img.naturalHeight > 0);
-                            return loadedImages.length > 0 || images.length === 0;
-                        }""",
-                        timeout=5000
-                    )
-                except:
-                    logger.debug("Image load wait timeout, proceeding...")
-                
-                # Try click interactions
-                logger.info("Attempting click interactions...")
-                try:
-                    await attempt_clicks(page, interactions)
-                except Exception as e:
-                    logger.warning(f"Click interactions failed: {e}")
-                    errors.append({"message": f"Click interactions error: {str(e)}", "phase": "interactions"})
-                
-                await page.wait_for_timeout(2000)
-                
-                # Try scroll/pagination
-                logger.info("Attempting scrolls...")
-                try:
-                    await attempt_scrolls(page, interactions, url)
-                except Exception as e:
-                    logger.warning(f"Scroll interactions failed: {e}")
-                    errors.append({"message": f"Scroll interactions error: {str(e)}", "phase": "interactions"})
-                
-                await page.wait_for_timeout(2000)
-                
-                # Final content verification
-                logger.info("Verifying final content state...")
-                try:
-                    final_content_check = await page.evaluate("""() => {
-                        const bodyText = (document.body.innerText || '').trim();
-                        const textLength = bodyText.length;
-                        const elementCount = document.querySelectorAll('article, section, main, p, h1, h2, h3, div').length;
-                        const imageCount = document.querySelectorAll('img[src], img[data-src]').length;
-                        const hasContent = textLength > 50 || elementCount > 3 || imageCount > 0;
-                        return {
-                            textLength: textLength,
-                            elementCount: elementCount,
-                            imageCount: imageCount,
-                            hasContent: hasContent
-                        };
-                    }""")
-                    
-                    logger.info(f"Final content check - text: {final_content_check['textLength']} chars, "
-                              f"elements: {final_content_check['elementCount']}, "
-                              f"images: {final_content_check['imageCount']}")
-                    
-                    if not final_content_check['hasContent']:
-                        logger.warning("Very little content detected, but proceeding with scrape...")
-                except Exception as e:
-                    logger.warning(f"Final content check error: {e}, proceeding anyway...")
-                
-                # Get final HTML
-                logger.info("Extracting content...")
-                html = await page.content()
-                tree = HTMLParser(html)
-                
-                result = parse_html_content(tree, url, html)
-                result["interactions"] = interactions
-                result["errors"] = errors
-                
-                logger.info(f"Successfully scraped {len(result['sections'])} sections")
-                return result
-                
-            except PlaywrightTimeout as e:
-                error_msg = f"Timeout: {str(e)}"
-                logger.error(error_msg)
-                errors.append({"message": error_msg, "phase": "render"})
-                raise HTTPException(status_code=408, detail="Page load timeout")
-            except HTTPException:
-                raise
-            except Exception as e:
-                error_msg = f"Scraping error: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                errors.append({"message": str(e), "phase": "scraping"})
-                raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
-    except HTTPException:
-        raise
-    except Exception as e:
-        error_msg = f"Playwright initialization error: {str(e)}"
+        browser = await get_browser()
+    except Exception as launch_error:
+        error_msg = f"Failed to launch browser: {str(launch_error)}"
         logger.error(error_msg, exc_info=True)
+        error_detail = str(launch_error)
         
-        error_detail = str(e)
+        # Check for common browser installation issues
         if any(keyword in error_detail.lower() for keyword in [
             "executable doesn't exist", "browser", "chromium",
             "not found", "cannot find", "no such file"
@@ -712,52 +752,320 @@ async def scrape_with_playwright(url: str) -> Dict[str, Any]:
         ]):
             error_detail = f"Permission error launching browser: {error_detail}"
         
-        raise HTTPException(status_code=500, detail=f"Playwright initialization failed: {error_detail}")
+        raise HTTPException(status_code=500, detail=error_detail)
+    
+    # Each scrape gets its own context (cookies, storage) on the shared browser;
+    # it is closed in the finally below however this scrape ends
+    context = None
+    try:
+        try:
+            context = await open_context(browser)
+            blocked_types = BLOCKED_RESOURCE_TYPES - {"image"} if load_images else BLOCKED_RESOURCE_TYPES
+            
+            async def block_resources(route):
+                if route.request.resource_type in blocked_types:
+                    await route.abort()
+                else:
+                    await route.continue_()
+            
+            await context.route("**/*", block_resources)
+            page = await context.new_page()
+            logger.info("New page created")
+        except Exception as page_error:
+            error_msg = f"Failed to create page: {str(page_error)}"
+            logger.error(error_msg, exc_info=True)
+            raise HTTPException(status_code=500, detail=error_msg)
+        
+        # Navigate to page with better wait strategy
+        logger.info(f"Navigating to {url}")
+        
+        # Try multiple wait strategies for better compatibility
+        navigation_strategies = [
+            ('domcontentloaded', 3000),
+            ('load', 2000),
+            ('networkidle', 1000),
+        ]
+        
+        navigation_success = False
+        last_error = None
+        for wait_until, extra_wait in navigation_strategies:
+            try:
+                logger.info(f"Trying navigation with wait_until='{wait_until}'...")
+                await page.goto(url, wait_until=wait_until, timeout=TIMEOUT_MS)
+                await page.wait_for_timeout(extra_wait)
+                logger.info(f"Page loaded with '{wait_until}' event")
+                navigation_success = True
+                break
+            except PlaywrightTimeout as e:
+                last_error = e
+                logger.info(f"'{wait_until}' timeout, trying next strategy...")
+                continue
+            except Exception as e:
+                last_error = e
+                logger.warning(f"Navigation error with '{wait_until}': {e}, trying next...")
+                continue
+        
+        if not navigation_success:
+            error_detail = f"Page load timeout - all strategies failed. Last error: {str(last_error) if last_error else 'Unknown'}"
+            logger.error(error_detail)
+            raise HTTPException(status_code=408, detail=error_detail)
+        
+        # Wait for content to render...
+        logger.info("Waiting for content to render...")
+        try:
+            await page.wait_for_function(
+                """() => {
+                    if (!document.body) return false;
+                    const text = document.body.innerText || '';
+                    const textLength = text.trim().length;
+                    const hasText = textLength > 50;
+                    const hasElements = document.querySelectorAll('article, section, main, [role="main"], .content, p, h1, h2, h3, div').length > 0;
+                    const hasImages = document.querySelectorAll('img[src], img[data-src], img[srcset], img[loading="lazy"]').length > 0;
+                    const hasContainers = document.querySelectorAll('div[class*="grid"], div[class*="card"], div[class*="item"], div[class*="photo"], div[class*="Image"], a[href*="/photos/"]').length > 0;
+                    return hasText || hasElements || hasImages || hasContainers;
+                }""",
+                timeout=25000
+            )
+            logger.info("Content detected")
+            await page.wait_for_timeout(4000)
+            
+            content_check = await page.evaluate("""() => {
+                const bodyText = (document.body.innerText || '').trim();
+                const hasText = bodyText.length > 100;
+                const hasElements = document.querySelectorAll('article, section, main, p, h1, h2, h3, div[class*="content"]').length > 3;
+                const hasImages = document.querySelectorAll('img[src], img[data-src]').length > 0;
+                const hasContainers = document.querySelectorAll('div[class*="grid"], div[class*="card"], div[class*="item"]').length > 0;
+                return hasText || hasElements || hasImages || hasContainers;
+            }""")
+            
+            if not content_check:
+                logger.warning("Content check failed - page may still be loading, waiting more...")
+                await page.wait_for_timeout(5000)
+        except PlaywrightTimeout:
+            logger.warning("Content wait timeout, checking if any content exists...")
+            has_any_content = False
+            try:
+                has_any_content = await page.evaluate("""() => {
+                    const bodyText = (document.body.innerText || '').trim();
+                    const hasText = bodyText.length > 50;
+                    const hasImages = document.querySelectorAll('img').length > 0;
+                    const hasElements = document.querySelectorAll('div, article, section').length > 5;
+                    return hasText || hasImages || hasElements;
+                }""")
+                if not has_any_content:
+                    logger.error("No content detected after timeout")
+                    raise HTTPException(status_code=408, detail="Page content did not load within timeout")
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.warning(f"Content check error: {e}")
+            if not has_any_content:
+                logger.error("No content detected after timeout")
+                raise HTTPException(status_code=408, detail="Page content did not load within timeout")
+            await page.wait_for_timeout(3000)
+        except Exception as e:
+            logger.warning(f"Content wait error: {e}, proceeding anyway...")
+            await page.wait_for_timeout(3000)
+        
+        logger.info("Page loaded successfully")
+        
+        # Remove noise elements (one round-trip for all selectors)
+        try:
+            await page.evaluate("""
+                (selector) => {
+                    try {
+                        // Below <body> only: it may carry e.g. "modal-open" itself
+                        document.body.querySelectorAll(selector).forEach(el => {
+                            try { el.remove(); } catch(e) {}
+                        });
+                    } catch(e) {}
+                }
+            """, NOISE_SELECTOR)
+        except Exception as e:
+            logger.debug(f"Failed to remove noise elements: {e}")
+        
+        # Wait for lazy-loaded images and content
+        logger.info("Waiting for lazy-loaded content...")
+        await page.wait_for_timeout(2000)
+        
+        # Blocked images never load, so only wait when they are allowed
+        if load_images:
+            try:
+                await page.wait_for_function(
+                    """() => {
+                        const images = Array.from(document.querySelectorAll('img'));
+                        const loadedImages = images.filter(img => img.complete && img.naturalHeight > 0);
+                        return loadedImages.length > 0 || images.length === 0;
+                    }""",
+                    timeout=5000
+                )
+            except Exception:
+                logger.debug("Image load wait timeout, proceeding...")
+        
+        # Try click interactions
+        logger.info("Attempting click interactions...")
+        try:
+            await attempt_clicks(page, interactions)
+        except Exception as e:
+            logger.warning(f"Click interactions failed: {e}")
+            errors.append({"message": f"Click interactions error: {str(e)}", "phase": "interactions"})
+        
+        await page.wait_for_timeout(2000)
+        
+        # Try scroll/pagination
+        logger.info("Attempting scrolls...")
+        try:
+            await attempt_scrolls(page, interactions, url)
+        except Exception as e:
+            logger.warning(f"Scroll interactions failed: {e}")
+            errors.append({"message": f"Scroll interactions error: {str(e)}", "phase": "interactions"})
+        
+        await page.wait_for_timeout(2000)
+        
+        # Final content verification; the same round-trip serializes the
+        # page the way page.content() does
+        logger.info("Verifying final content state...")
+        html = None
+        try:
+            final_content_check = await page.evaluate("""() => {
+                const bodyText = (document.body.innerText || '').trim();
+                const textLength = bodyText.length;
+                const elementCount = document.querySelectorAll('article, section, main, p, h1, h2, h3, div').length;
+                const imageCount = document.querySelectorAll('img[src], img[data-src]').length;
+                const hasContent = textLength > 50 || elementCount > 3 || imageCount > 0;
+                let html = '';
+                if (document.doctype)
+                    html = new XMLSerializer().serializeToString(document.doctype);
+                if (document.documentElement)
+                    html += document.documentElement.outerHTML;
+                return {
+                    textLength: textLength,
+                    elementCount: elementCount,
+                    imageCount: imageCount,
+                    hasContent: hasContent,
+                    html: html
+                };
+            }""")
+            html = final_content_check['html']
+            
+            logger.info(f"Final content check - text: {final_content_check['textLength']} chars, "
+                      f"elements: {final_content_check['elementCount']}, "
+                      f"images: {final_content_check['imageCount']}")
+            
+            if not final_content_check['hasContent']:
+                logger.warning("Very little content detected, but proceeding with scrape...")
+        except Exception as e:
+            logger.warning(f"Final content check error: {e}, proceeding anyway...")
+        
+        # Get final HTML
+        logger.info("Extracting content...")
+        if html is None:
+            html = await page.content()
+        result = await asyncio.to_thread(parse_rendered, html, url)
+        result["interactions"] = interactions
+        result["errors"] = errors
+        
+        logger.info(f"Successfully scraped {len(result['sections'])} sections")
+        return result
+        
+    except PlaywrightTimeout as e:
+        error_msg = f"Timeout: {str(e)}"
+        logger.error(error_msg)
+        errors.append({"message": error_msg, "phase": "render"})
+        raise HTTPException(status_code=408, detail="Page load timeout")
+    except HTTPException:
+        raise
+    except Exception as e:
+        error_msg = f"Scraping error: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        errors.append({"message": str(e), "phase": "scraping"})
+        raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
+    finally:
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Failed to close browser context: {e}")
 
 async def attempt_clicks(page, interactions: Dict) -> bool:
     """Attempt to click tabs or 'Load more' buttons"""
-    click_selectors = [
-        'button:has-text("Load more")',
-        'button:has-text("Show more")',
-        'a:has-text("Load more")',
-        '[role="tab"]',
-        '[data-testid*="more"]',
-        '.load-more',
-        '#load-more',
-        'button[aria-label*="more" i]',
-        'button[aria-label*="load" i]'
-    ]
+    # One wait for any clickable instead of up to 2s per selector
+    try:
+        # ">> visible=true" waits for any visible match; state="visible" would only
+        # check the first one, so one hidden early match hid every other target
+        await page.wait_for_selector(f"{CLICK_SELECTOR} >> visible=true", timeout=2000)
+    except Exception:
+        return False  # Nothing to click on this page
+    
+    # Count DOM mutations so the post-click wait can end as soon as the page
+    # reacts instead of always sleeping SCROLL_WAIT_MS
+    try:
+        await page.evaluate("""() => {
+            if (window.__scraperMutations === undefined) {
+                window.__scraperMutations = 0;
+                new MutationObserver(records => { window.__scraperMutations += records.length; })
+                    .observe(document.body, { childList: true, subtree: true, characterData: true });
+            }
+        }""")
+    except Exception as e:
+        logger.debug(f"Failed to install mutation observer: {e}")
     
     clicked = False
-    for selector in click_selectors:
+    for selector in CLICK_SELECTORS:
         try:
-            # Wait for selector to be available
+            # Hidden matches are filtered in the query, and click() scrolls
+            # the element into view itself
+            elements = await page.query_selector_all(f"{selector} >> visible=true")
+            if not elements:
+                continue
             try:
-                await page.wait_for_selector(selector, timeout=2000, state='visible')
-            except:
-                continue  # Selector not found, try next
-            
-            elements = await page.query_selector_all(selector)
+                mutations_before = await page.evaluate('() => window.__scraperMutations || 0')
+            except Exception:
+                mutations_before = 0
+            selector_clicked = False
             for elem in elements[:3]:  # Limit to 3 clicks
                 try:
-                    if await elem.is_visible():
-                        # Scroll element into view before clicking
-                        await elem.scroll_into_view_if_needed()
-                        await page.wait_for_timeout(500)  # Small wait before click
-                        await elem.click()
-                        await page.wait_for_timeout(SCROLL_WAIT_MS)  # Wait for content to load
-                        interactions["clicks"].append(selector)
-                        clicked = True
-                        logger.info(f"Clicked element: {selector}")
+                    await elem.click()
+                    interactions["clicks"].append(selector)
+                    clicked = selector_clicked = True
+                    logger.info(f"Clicked element: {selector}")
                 except Exception as e:
                     logger.debug(f"Failed to click {selector}: {e}")
                     continue
+            if selector_clicked:
+                # Wait for content to load: returns on the first DOM change,
+                # or after SCROLL_WAIT_MS if the click changed nothing
+                try:
+                    await page.wait_for_function(
+                        '(before) => (window.__scraperMutations || 0) > before',
+                        arg=mutations_before,
+                        timeout=SCROLL_WAIT_MS
+                    )
+                except Exception:
+                    pass
         except Exception as e:
             logger.debug(f"Error with selector {selector}: {e}")
             continue
     
     return clicked
 
+async def find_next_page(page, base_url: str) -> Optional[str]:
+    """URL of the first visible same-domain "next" link, by selector priority"""
+    for selector in PAGINATION_SELECTORS:
+        try:
+            # visible=true lets Playwright skip hidden matches in the same query
+            next_link = await page.query_selector(f"{selector} >> visible=true")
+            if not next_link:
+                continue
+            href = await next_link.get_attribute('href')
+            if href:
+                full_url = urljoin(page.url, href)
+                if is_same_domain(base_url, full_url):
+                    return full_url
+        except Exception as e:
+            logger.debug(f"Error with pagination selector {selector}: {e}")
+    return None
+
 async def attempt_scrolls(page, interactions: Dict, base_url: str) -> bool:
     """Attempt infinite scroll or pagination"""
     scrolled = False
@@ -765,32 +1073,33 @@ async def attempt_scrolls(page, interactions: Dict, base_url: str) -> bool:
     # Try infinite scroll with better detection for lazy-loaded content
     for i in range(MAX_SCROLLS):
         try:
-            # Get initial state
-            prev_state = await page.evaluate("""() => {
-                return {
-                    height: document.body.scrollHeight,
-                    textLength: (document.body.innerText || '').trim().length,
-                    imageCount: document.querySelectorAll('img[src], img[data-src]').length,
-                    elementCount: document.querySelectorAll('div, article, section').length
-                };
-            }""")
-            
-            # Scroll to bottom smoothly
-            await page.evaluate('window.scrollTo({ top: document.body.scrollHeight, behavior: "smooth" })')
-            await page.wait_for_timeout(SCROLL_WAIT_MS)
-            
-            # Wait a bit more for lazy-loaded content (images, etc.)
-            await page.wait_for_timeout(1000)
-            
-            # Get new state
-            new_state = await page.evaluate("""() => {
-                return {
+            # Snapshot, scroll, wait for new content and snapshot again in one
+            # round-trip; the wait ends early as soon as the page grows
+            state = await page.evaluate("""async (waitMs) => {
+                const snap = () => ({
                     height: document.body.scrollHeight,
                     textLength: (document.body.innerText || '').trim().length,
                     imageCount: document.querySelectorAll('img[src], img[data-src]').length,
                     elementCount: document.querySelectorAll('div, article, section').length
-                };
-            }""")
+                });
+                const grew = (prev, cur) => cur.height > prev.height
+                    || cur.textLength > prev.textLength + 50
+                    || cur.imageCount > prev.imageCount
+                    || cur.elementCount > prev.elementCount + 5;
+                
+                const prev = snap();
+                // Explicitly instant: CSS scroll-behavior: smooth would animate it
+                window.scrollTo({ top: prev.height, behavior: 'instant' });
+                const deadline = performance.now() + waitMs;
+                let cur = prev;
+                while (performance.now() < deadline) {
+                    await new Promise(resolve => setTimeout(resolve, 100));
+                    cur = snap();
+                    if (grew(prev, cur)) break;
+                }
+                return { prev: prev, next: cur };
+            }""", SCROLL_WAIT_MS + 1000)
+            prev_state, new_state = state['prev'], state['next']
             
             # Check if new content loaded (height, text, images, or elements increased)
             height_increased = new_state['height'] > prev_state['height']
@@ -810,61 +1119,137 @@ async def attempt_scrolls(page, interactions: Dict, base_url: str) -> bool:
             logger.debug(f"Scroll error: {e}")
             break
     
-    # Try pagination links
+    # Try pagination links: one hop per iteration, up to MAX_SCROLLS pages
     if not scrolled:
-        pagination_selectors = ['a[rel="next"]', '.next', '.pagination a:has-text("Next")', 'a:has-text("›")']
-        for selector in pagination_selectors:
-            for i in range(MAX_SCROLLS):
-                try:
-                    next_link = await page.query_selector(selector)
-                    if next_link and await next_link.is_visible():
-                        href = await next_link.get_attribute('href')
-                        if href:
-                            full_url = urljoin(base_url, href)
-                            if is_same_domain(base_url, full_url):
-                                try:
-                                    await page.goto(full_url, wait_until='networkidle', timeout=TIMEOUT_MS)
-                                except PlaywrightTimeout:
-                                    try:
-                                        await page.goto(full_url, wait_until='load', timeout=TIMEOUT_MS)
-                                        await page.wait_for_timeout(2000)
-                                    except:
-                                        break  # If navigation fails, stop pagination
-                                await page.wait_for_timeout(1500)  # Extra wait for content
-                                interactions["pages"].append(full_url)
-                                scrolled = True
-                    else:
-                        break
-                except:
-                    break
+        for i in range(MAX_SCROLLS):
+            full_url = await find_next_page(page, base_url)
+            if not full_url:
+                break
+            # networkidle often never fires on pages with ads/analytics;
+            # take the DOM and give 'load' a short, bounded chance
+            try:
+                await page.goto(full_url, wait_until='domcontentloaded', timeout=TIMEOUT_MS)
+            except Exception:
+                break  # If navigation fails, stop pagination
+            try:
+                await page.wait_for_load_state('load', timeout=3000)
+            except PlaywrightTimeout:
+                pass
+            await page.wait_for_timeout(1500)  # Extra wait for content
+            interactions["pages"].append(full_url)
+            scrolled = True
     
     return scrolled
 
+# --- Lifecycle ---
+@app.on_event("startup")
+async def startup():
+    """Create shared resources reused across requests"""
+    app.state.http_client = httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=10.0,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=MAX_HTTP_CONNECTIONS
+        ),
+        headers={'User-Agent': USER_AGENT}
+    )
+    app.state.browser_slots = asyncio.Semaphore(MAX_CONCURRENT_BROWSERS)
+    # Browser is launched lazily by get_browser() and reused across scrapes
+    app.state.playwright = None
+    app.state.browser = None
+    app.state.browser_launch = None  # In-flight launch_browser() task
+    app.state.browser_lock = asyncio.Lock()
+    logger.info("Shared HTTP client created")
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release shared resources"""
+    await app.state.http_client.aclose()
+    logger.info("Shared HTTP client closed")
+    launch = app.state.browser_launch
+    if launch is not None and not launch.done():
+        # Let an in-flight launch finish so its processes are stopped below
+        try:
+            await launch
+        except Exception as e:
+            logger.debug(f"Browser launch failed during shutdown: {e}")
+    if app.state.browser is not None:
+        try:
+            await app.state.browser.close()
+        except Exception as e:
+            logger.debug(f"Failed to close browser: {e}")
+    if app.state.playwright is not None:
+        await app.state.playwright.stop()
+        logger.info("Shared browser stopped")
+
 # --- API Endpoints ---
-@app.post("/scrape")
-async def scrape_url(request: ScrapeRequest):
-    """Main scraping endpoint"""
-    url = str(request.url)
-    logger.info(f"=== Scrape request received for: {url} ===")
-    
-    # Validate URL scheme
-    if not url.startswith(('http://', 'https://')):
-        logger.error(f"Invalid URL scheme: {url}")
-        raise HTTPException(status_code=400, detail="Only http(s) URLs are supported")
+async def scrape_in_browser(url: str, load_images: bool) -> Dict[str, Any]:
+    """Playwright scrape holding one of the browser slots"""
+    # Bound concurrent browser scrapes; other requests keep being served meanwhile
+    async with app.state.browser_slots:
+        return await scrape_with_playwright(url, load_images)
+
+def discard_task(task: asyncio.Task) -> None:
+    """Cancel a task whose result is no longer needed"""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()  # Mark a failure as retrieved so asyncio doesn't log it
+
+async def scrape_stages(url: str, load_images: bool):
+    """Yield (method, result) pairs as the scrape progresses.
     
+    ("playwright", None) announces the browser fallback; the last pair
+    carries the final result.
+    """
+    static_task = asyncio.create_task(scrape_static(url))
+    browser_task = None
     try:
+        if SPECULATIVE_PLAYWRIGHT_DELAY is not None:
+            # A static fetch that is still running after the delay is often a
+            # slow or JS-heavy page: start the browser scrape alongside it so
+            # it doesn't wait for static to fail first; dropped if static works
+            done, _ = await asyncio.wait({static_task}, timeout=SPECULATIVE_PLAYWRIGHT_DELAY)
+            if not done:
+                browser_task = asyncio.create_task(scrape_in_browser(url, load_images))
+        
         # Try static scraping first
-        result = await scrape_static(url)
+        result = await static_task
         
         if result:
-            logger.info("Returning static scraping result")
-            return {"result": result, "method": "static"}
+            yield "static", result
+            return
         
         # Fallback to Playwright
         logger.info("Falling back to Playwright scraping")
-        result = await scrape_with_playwright(url)
-        logger.info("Returning Playwright scraping result")
-        return {"result": result, "method": "playwright"}
+        yield "playwright", None
+        if browser_task is None:
+            browser_task = asyncio.create_task(scrape_in_browser(url, load_images))
+        yield "playwright", await browser_task
+    finally:
+        discard_task(static_task)
+        if browser_task is not None:
+            discard_task(browser_task)
+
+def ndjson_line(data: Dict[str, Any]) -> bytes:
+    """One newline-terminated JSON record for streamed responses"""
+    return orjson.dumps(data) + b"\n"
+
+@app.post("/scrape")
+async def scrape_url(request: ScrapeRequest):
+    """Main scraping endpoint"""
+    # Scheme/host already validated by ScrapeRequest
+    url = request.url
+    logger.info(f"=== Scrape request received for: {url} ===")
+    
+    try:
+        async with aclosing(scrape_stages(url, request.load_images)) as stages:
+            async for method, result in stages:
+                if result is not None:
+                    logger.info(f"Returning {method} scraping result")
+                    return {"result": result, "method": method}
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
@@ -877,390 +1262,62 @@ async def scrape_url(request: ScrapeRequest):
             detail=error_msg
         )
 
+@app.post("/scrape/stream")
+async def scrape_url_stream(request: ScrapeRequest):
+    """/scrape as NDJSON: progress first, then the result one section per line"""
+    url = request.url
+    logger.info(f"=== Streaming scrape request received for: {url} ===")
+    
+    async def events():
+        try:
+            async with aclosing(scrape_stages(url, request.load_images)) as stages:
+                async for method, result in stages:
+                    if result is None:
+                        yield ndjson_line({"phase": "fallback", "method": method})
+                        continue
+                    header = {key: value for key, value in result.items() if key != "sections"}
+                    yield ndjson_line({"phase": "result", "method": method, "result": header})
+                    for section in result["sections"]:
+                        yield ndjson_line({"phase": "section", "section": section})
+                    yield ndjson_line({"phase": "complete", "method": method,
+                                       "sections": len(result["sections"])})
+        except HTTPException as e:
+            yield ndjson_line({"phase": "error", "status": e.status_code, "detail": e.detail})
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            yield ndjson_line({"phase": "error", "status": 500, "detail": error_msg})
+    
+    # Not gzipped (see StreamAwareGZipMiddleware), so lines arrive as produced
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
 @app.get("/healthz")
 async def health_check():
-    """Health check endpoint - also verifies Playwright is available"""
-    status = {"status": "ok", "timestamp": datetime.utcnow().isoformat()}
+    """Health check endpoint - also reports the shared browser's state"""
+    status = {"status": "ok", "timestamp": utc_timestamp()}
     
-    # Check if Playwright browsers are installed
-    try:
-        async with async_playwright() as p:
-            try:
-                # Platform-specific args
-                launch_args = []
-                if sys.platform != 'win32':
-                    launch_args = ['--no-sandbox']
-                
-                browser = await p.chromium.launch(headless=True, args=launch_args)
-                await browser.close()
-                status["playwright"] = "ready"
-            except Exception as e:
-                status["playwright"] = f"error: {str(e)[:100]}"
-                status["playwright_help"] = "Run: playwright install chromium"
-    except Exception as e:
-        status["playwright"] = f"initialization_error: {str(e)[:100]}"
+    # Read-only: probes never launch or connect a browser, that is left to
+    # scrapes. A failed launch is reported until a scrape retries it.
+    browser = app.state.browser
+    launch = app.state.browser_launch
+    if browser is not None and browser.is_connected():
+        status["playwright"] = "ready"
+    elif launch is not None and not launch.done():
+        status["playwright"] = "starting"
+    elif launch is not None and not launch.cancelled() and launch.exception() is not None:
+        status["playwright"] = f"error: {str(launch.exception())[:100]}"
+        if PLAYWRIGHT_CDP_URL:
+            status["playwright_help"] = f"Check the browser at {PLAYWRIGHT_CDP_URL}"
+        else:
+            status["playwright_help"] = "Run: playwright install chromium"
+    elif browser is not None:
+        status["playwright"] = "disconnected"
+    else:
+        status["playwright"] = "not started"
     
     return status
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve frontend"""
-    html = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Universal Website Scraper</title>
-        <style>
-            * { box-sizing: border-box; margin: 0; padding: 0; }
-            body { 
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                padding: 20px;
-            }
-            .container {
-                max-width: 1200px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 16px;
-                box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                overflow: hidden;
-            }
-            .header {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 40px;
-                text-align: center;
-            }
-            .header h1 { font-size: 2.5em; margin-bottom: 10px; }
-            .header p { opacity: 0.9; font-size: 1.1em; }
-            .content { padding: 40px; }
-            .input-group {
-                display: flex;
-                gap: 10px;
-                margin-bottom: 30px;
-            }
-            input[type="url"] {
-                flex: 1;
-                padding: 15px;
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                font-size: 16px;
-                transition: border 0.3s;
-            }
-            input[type="url"]:focus {
-                outline: none;
-                border-color: #667eea;
-            }
-            button {
-                padding: 15px 40px;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: 600;
-                cursor: pointer;
-                transition: transform 0.2s, box-shadow 0.2s;
-            }
-            button:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-            button:active { transform: translateY(0); }
-            button:disabled {
-                opacity: 0.6;
-                cursor: not-allowed;
-                transform: none;
-            }
-            .status {
-                padding: 15px;
-                border-radius: 8px;
-                margin-bottom: 20px;
-                display: none;
-            }
-            .status.loading {
-                background: #e3f2fd;
-                color: #1976d2;
-                display: block;
-            }
-            .status.success {
-                background: #e8f5e9;
-                color: #2e7d32;
-                display: block;
-            }
-            .status.error {
-                background: #ffebee;
-                color: #c62828;
-                display: block;
-            }
-            .accordion {
-                margin-top: 20px;
-            }
-            .accordion-item {
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                margin-bottom: 10px;
-                overflow: hidden;
-            }
-            .accordion-header {
-                padding: 15px 20px;
-                background: #f5f5f5;
-                cursor: pointer;
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                transition: background 0.3s;
-            }
-            .accordion-header:hover { background: #eeeeee; }
-            .accordion-header.active { background: #667eea; color: white; }
-            .accordion-content {
-                padding: 20px;
-                display: none;
-                background: #fafafa;
-            }
-            .accordion-content.active { display: block; }
-            pre {
-                background: #263238;
-                color: #aed581;
-                padding: 20px;
-                border-radius: 8px;
-                overflow-x: auto;
-                font-size: 13px;
-                line-height: 1.5;
-            }
-            .download-btn {
-                margin-top: 15px;
-                padding: 10px 20px;
-                font-size: 14px;
-            }
-            .meta-info {
-                background: #f0f4ff;
-                padding: 20px;
-                border-radius: 8px;
-                margin-bottom: 20px;
-            }
-            .meta-info h3 { color: #667eea; margin-bottom: 15px; }
-            .meta-info p { margin: 8px 0; color: #555; }
-            .loader {
-                border: 3px solid #f3f3f3;
-                border-top: 3px solid #667eea;
-                border-radius: 50%;
-                width: 30px;
-                height: 30px;
-                animation: spin 1s linear infinite;
-                display: inline-block;
-                margin-right: 10px;
-            }
-            @keyframes spin {
-                0% { transform: rotate(0deg); }
-                100% { transform: rotate(360deg); }
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🔍 Universal Website Scraper</h1>
-                <p>Extract structured content from any website with intelligent parsing</p>
-            </div>
-            
-            <div class="content">
-                <div class="input-group">
-                    <input type="url" id="urlInput" placeholder="https://example.com" required>
-                    <button id="scrapeButton" onclick="scrapeWebsite()">Scrape Website</button>
-                </div>
-                
-                <div id="status" class="status"></div>
-                
-                <div id="results"></div>
-            </div>
-        </div>
-
-        <script>
-            let currentData = null;
-
-            async function scrapeWebsite() {
-                const url = document.getElementById('urlInput').value;
-                const statusDiv = document.getElementById('status');
-                const resultsDiv = document.getElementById('results');
-                const button = document.getElementById('scrapeButton');
-                
-                if (!url) {
-                    showStatus('error', 'Please enter a valid URL');
-                    return;
-                }
-
-                // Disable button during scraping
-                if (button) {
-                    button.disabled = true;
-                    button.textContent = 'Scraping...';
-                }
-                
-                showStatus('loading', 'Scraping website... This may take a few moments');
-                resultsDiv.innerHTML = '';
-                currentData = null;
-                
-                try {
-                    const response = await fetch('/scrape', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ url: url })
-                    });
-                    
-                    if (!response.ok) {
-                        const errorData = await response.json();
-                        throw new Error(errorData.detail || `HTTP ${response.status}`);
-                    }
-                    
-                    const data = await response.json();
-                    currentData = data.result;
-                    
-                    if (!currentData || !currentData.sections) {
-                        throw new Error('Invalid response: missing sections');
-                    }
-                    
-                    showStatus('success', `✓ Successfully scraped ${currentData.sections.length} sections using ${data.method} method`);
-                    displayResults(currentData);
-                } catch (error) {
-                    showStatus('error', `✗ Error: ${error.message}`);
-                    currentData = null;
-                } finally {
-                    // Re-enable button
-                    if (button) {
-                        button.disabled = false;
-                        button.textContent = 'Scrape Website';
-                    }
-                }
-            }
-
-            function showStatus(type, message) {
-                const statusDiv = document.getElementById('status');
-                statusDiv.className = `status ${type}`;
-                statusDiv.innerHTML = type === 'loading' 
-                    ? `<div class="loader"></div>${message}`
-                    : message;
-            }
-
-            function displayResults(data) {
-                const resultsDiv = document.getElementById('results');
-                
-                if (!data || !data.meta || !data.sections) {
-                    resultsDiv.innerHTML = '<div class="status error">Invalid data structure received</div>';
-                    return;
-                }
-                
-                // Escape HTML to prevent XSS
-                function escapeHtml(text) {
-                    const div = document.createElement('div');
-                    div.textContent = text;
-                    return div.innerHTML;
-                }
-                
-                // Meta information
-                const metaHtml = `
-                    <div class="meta-info">
-                        <h3>Page Information</h3>
-                        <p><strong>Title:</strong> ${escapeHtml(data.meta.title || 'N/A')}</p>
-                        <p><strong>URL:</strong> <a href="${escapeHtml(data.url || '')}" target="_blank">${escapeHtml(data.url || 'N/A')}</a></p>
-                        <p><strong>Language:</strong> ${escapeHtml(data.meta.language || 'en')}</p>
-                        <p><strong>Scraped At:</strong> ${data.scrapedAt ? new Date(data.scrapedAt).toLocaleString() : 'N/A'}</p>
-                        <p><strong>Sections Found:</strong> ${data.sections ? data.sections.length : 0}</p>
-                        <button class="download-btn" onclick="downloadJSON()">📥 Download Full JSON</button>
-                    </div>
-                `;
-                
-                // Sections accordion
-                const sectionsHtml = (data.sections || []).map((section, index) => {
-                    const label = escapeHtml(section.label || `Section ${index + 1}`);
-                    const type = escapeHtml(section.type || 'unknown');
-                    const sectionJson = JSON.stringify(section, null, 2);
-                    return `
-                    <div class="accordion-item">
-                        <div class="accordion-header" onclick="toggleAccordion(${index})">
-                            <span><strong>${label}</strong> (${type})</span>
-                            <span>▼</span>
-                        </div>
-                        <div class="accordion-content" id="content-${index}">
-                            <pre>${sectionJson}</pre>
-                            <button class="download-btn" onclick="downloadSection(${index})">Download Section JSON</button>
-                        </div>
-                    </div>
-                `;
-                }).join('');
-                
-                resultsDiv.innerHTML = metaHtml + '<div class="accordion">' + sectionsHtml + '</div>';
-            }
-
-            function toggleAccordion(index) {
-                const content = document.getElementById(`content-${index}`);
-                const header = content.previousElementSibling;
-                
-                const isActive = content.classList.contains('active');
-                
-                // Close all others
-                document.querySelectorAll('.accordion-content').forEach(el => el.classList.remove('active'));
-                document.querySelectorAll('.accordion-header').forEach(el => el.classList.remove('active'));
-                
-                if (!isActive) {
-                    content.classList.add('active');
-                    header.classList.add('active');
-                }
-            }
-
-            function downloadJSON() {
-                if (!currentData) {
-                    alert('No data available to download. Please scrape a website first.');
-                    return;
-                }
-                try {
-                    const dataStr = JSON.stringify(currentData, null, 2);
-                    const blob = new Blob([dataStr], { type: 'application/json' });
-                    const url = URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-                    a.download = `scrape-${timestamp}.json`;
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                    URL.revokeObjectURL(url);
-                } catch (error) {
-                    alert('Error downloading JSON: ' + error.message);
-                }
-            }
-
-            function downloadSection(index) {
-                if (!currentData || !currentData.sections || !currentData.sections[index]) {
-                    alert('Section data not available.');
-                    return;
-                }
-                try {
-                    const section = currentData.sections[index];
-                    const dataStr = JSON.stringify(section, null, 2);
-                    const blob = new Blob([dataStr], { type: 'application/json' });
-                    const url = URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    const safeId = (section.id || `section-${index}`).replace(/[^a-z0-9-]/gi, '-');
-                    a.download = `${safeId}.json`;
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                    URL.revokeObjectURL(url);
-                } catch (error) {
-                    alert('Error downloading section: ' + error.message);
-                }
-            }
-
-            // Allow Enter key to submit
-            document.getElementById('urlInput').addEventListener('keypress', (e) => {
-                if (e.key === 'Enter') scrapeWebsite();
-            });
-        </script>
-    </body>
-    </html>
-    """
-    return html
\ No newline at end of file
+async def root(request: Request):
+    """Serve frontend (ETag / If-None-Match handled by StaticFiles)"""
+    return await static_files.get_response("index.html", request.scope)
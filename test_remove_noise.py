@@ -0,0 +1,23 @@
+"""
+Offline checks for static noise removal, run against saved fixtures
+"""
+from pathlib import Path
+
+from main import parse_static
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+def test_modal_open_body_is_kept():
+    """A noise-like class on <body> must not take the whole page with it"""
+    html = (FIXTURES / "modal_open_body.html").read_bytes()
+    result = parse_static(html, "https://example.com/modal")
+    assert result is not None
+
+    text = " ".join(section["content"]["text"] for section in result["sections"])
+    assert "must never be removed" in text
+    assert "Accept all cookies" not in text
+    assert "Subscribe to our newsletter" not in text
+
+if __name__ == "__main__":
+    test_modal_open_body_is_kept()
+    print("✓ Noise removal keeps a modal-open <body>")
@@ -2,8 +2,9 @@
 Test script for the Universal Website Scraper
 Tests the three required URLs and validates output
 """
+import asyncio
 import httpx
-import json
+import orjson
 import sys
 from datetime import datetime
 
@@ -30,6 +31,14 @@ TEST_URLS = [
 
 API_URL = "http://localhost:8000/scrape"
 
+async def fetch_all() -> list:
+    """POST every test URL at once; errors are returned in place of responses"""
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        return await asyncio.gather(
+            *(client.post(API_URL, json={"url": test["url"]}) for test in TEST_URLS),
+            return_exceptions=True
+        )
+
 def test_scraper():
     """Run tests on all URLs"""
     print("=" * 70)
@@ -39,20 +48,19 @@ def test_scraper():
     
     results = []
     
-    for i, test in enumerate(TEST_URLS, 1):
+    # Requests run concurrently; results are reported in order below
+    responses = asyncio.run(fetch_all())
+    
+    for i, (test, response) in enumerate(zip(TEST_URLS, responses), 1):
         print(f"Test {i}/{len(TEST_URLS)}: {test['name']}")
         print(f"URL: {test['url']}")
         print("-" * 70)
         
         try:
-            # Make request
-            with httpx.Client(timeout=60.0) as client:
-                response = client.post(
-                    API_URL,
-                    json={"url": test["url"]}
-                )
-                response.raise_for_status()
-                data = response.json()
+            if isinstance(response, Exception):
+                raise response
+            response.raise_for_status()
+            data = orjson.loads(response.content)
             
             result = data.get("result", {})
             method = data.get("method", "unknown")
@@ -90,8 +98,8 @@ def test_scraper():
             
             # Save output
             filename = f"test_output_{i}.json"
-            with open(filename, "w", encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
             print(f"  Output saved to: {filename}")
             
         except httpx.HTTPError as e: